@@ -1,3 +1,4 @@
+using System.Text.Json;
 using LearnedGeek.Models;
 using LearnedGeek.Services;
 using Microsoft.AspNetCore.Hosting;
@@ -6,16 +7,44 @@ using Moq;
 
 namespace LearnedGeek.Tests;
 
-public class BlogServiceTests
+public class BlogServiceTests : IDisposable
 {
     private readonly IBlogService _blogService;
+    private readonly List<string> _tempContentRoots = [];
 
     public BlogServiceTests()
     {
-        var mockEnv = new Mock<IWebHostEnvironment>();
-        mockEnv.Setup(e => e.ContentRootPath).Returns(AppContext.BaseDirectory);
+        _blogService = CreateServiceFor(AppContext.BaseDirectory);
+    }
+
+    public void Dispose()
+    {
+        foreach (var root in _tempContentRoots)
+        {
+            if (Directory.Exists(root))
+                Directory.Delete(root, recursive: true);
+        }
+    }
+
+    // Copies the fixture posts.json into a throwaway content root so save tests
+    // don't modify the shared fixture
+    private BlogService CreateServiceWithTempContent(out string contentRoot)
+    {
+        contentRoot = Path.Combine(Path.GetTempPath(), $"learnedgeek-tests-{Guid.NewGuid():N}");
+        Directory.CreateDirectory(Path.Combine(contentRoot, "Content"));
+        File.Copy(
+            Path.Combine(AppContext.BaseDirectory, "Content", "posts.json"),
+            Path.Combine(contentRoot, "Content", "posts.json"));
+        _tempContentRoots.Add(contentRoot);
 
-        _blogService = new BlogService(mockEnv.Object, Mock.Of<ILogger<BlogService>>());
+        return CreateServiceFor(contentRoot);
+    }
+
+    private static BlogService CreateServiceFor(string contentRoot)
+    {
+        var mockEnv = new Mock<IWebHostEnvironment>();
+        mockEnv.Setup(e => e.ContentRootPath).Returns(contentRoot);
+        return new BlogService(mockEnv.Object, Mock.Of<ILogger<BlogService>>());
     }
 
     [Fact]
@@ -127,4 +156,121 @@ public class BlogServiceTests
         Assert.True(post.Featured);
         Assert.Null(post.Image);
     }
+
+    [Fact]
+    public async Task UpdatePostDateAsync_RepositionsPostInDateOrder()
+    {
+        // Arrange
+        var blogService = CreateServiceWithTempContent(out var contentRoot);
+        await blogService.GetAllPostsIncludingFutureAsync(); // warm the date-ordered cache
+
+        // Act
+        var result = await blogService.UpdatePostDateAsync("test-post-woodworking", new DateTime(2026, 2, 1));
+        var posts = (await blogService.GetAllPostsIncludingFutureAsync()).ToList();
+
+        // Assert
+        Assert.True(result);
+        Assert.Equal(new[] { "test-post-woodworking", "test-post-computers" }, posts.Select(p => p.Slug));
+
+        // A fresh service reading the saved file agrees
+        var reloaded = CreateServiceFor(contentRoot);
+        var reloadedPosts = (await reloaded.GetAllPostsIncludingFutureAsync()).ToList();
+        Assert.Equal(new[] { "test-post-woodworking", "test-post-computers" }, reloadedPosts.Select(p => p.Slug));
+    }
+
+    [Fact]
+    public async Task UpdatePostDateAsync_KeepsDateOrderWhenSaveFails()
+    {
+        // Arrange
+        var blogService = CreateServiceWithTempContent(out var contentRoot);
+        await blogService.GetAllPostsIncludingFutureAsync(); // warm the date-ordered cache
+        Directory.Delete(contentRoot, recursive: true); // make the save throw
+
+        // Act
+        await Assert.ThrowsAnyAsync<IOException>(() =>
+            blogService.UpdatePostDateAsync("test-post-woodworking", new DateTime(2026, 2, 1)));
+        var posts = (await blogService.GetAllPostsIncludingFutureAsync()).ToList();
+
+        // Assert - the in-memory date changed, so the ordering must reflect it
+        Assert.Equal(new[] { "test-post-woodworking", "test-post-computers" }, posts.Select(p => p.Slug));
+    }
+
+    [Fact]
+    public async Task UpdatePostDatesAsync_ReordersPosts()
+    {
+        // Arrange
+        var blogService = CreateServiceWithTempContent(out _);
+        await blogService.GetAllPostsIncludingFutureAsync(); // warm the date-ordered cache
+
+        // Act
+        var result = await blogService.UpdatePostDatesAsync(new Dictionary<string, DateTime>
+        {
+            ["TEST-POST-COMPUTERS"] = new DateTime(2025, 11, 1),
+            ["test-post-woodworking"] = new DateTime(2025, 12, 20)
+        });
+        var posts = (await blogService.GetAllPostsIncludingFutureAsync()).ToList();
+
+        // Assert
+        Assert.True(result);
+        Assert.Equal(new[] { "test-post-woodworking", "test-post-computers" }, posts.Select(p => p.Slug));
+    }
+
+    [Fact]
+    public async Task UpdatePostLinkedInDateAsync_SavesCamelCaseJsonWithoutNulls()
+    {
+        // Arrange - view a post first so its cached entry carries rendered content
+        var blogService = CreateServiceWithTempContent(out var contentRoot);
+        Directory.CreateDirectory(Path.Combine(contentRoot, "Content", "posts"));
+        File.Copy(
+            Path.Combine(AppContext.BaseDirectory, "Content", "posts", "test-post-computers.md"),
+            Path.Combine(contentRoot, "Content", "posts", "test-post-computers.md"));
+        var viewed = await blogService.GetPostBySlugAsync("test-post-computers");
+        Assert.NotNull(viewed?.HtmlContent);
+
+        // Act
+        var result = await blogService.UpdatePostLinkedInDateAsync("test-post-computers", new DateTime(2026, 3, 1));
+        using var saved = JsonDocument.Parse(
+            await File.ReadAllTextAsync(Path.Combine(contentRoot, "Content", "posts.json")));
+
+        // Assert
+        Assert.True(result);
+        var posts = saved.RootElement.GetProperty("posts").EnumerateArray().ToList();
+        var computers = posts.Single(p => p.GetProperty("slug").GetString() == "test-post-computers");
+        var woodworking = posts.Single(p => p.GetProperty("slug").GetString() == "test-post-woodworking");
+
+        Assert.Equal("2026-03-01T00:00:00", computers.GetProperty("linkedInPostedDate").GetString());
+        Assert.Equal("tech", computers.GetProperty("category").GetString());
+        Assert.Equal("personal", woodworking.GetProperty("category").GetString());
+        Assert.False(computers.TryGetProperty("Slug", out _));
+        Assert.False(computers.TryGetProperty("image", out _));
+        Assert.False(woodworking.TryGetProperty("linkedInPostedDate", out _));
+        Assert.False(computers.TryGetProperty("content", out _));
+        Assert.False(computers.TryGetProperty("htmlContent", out _));
+    }
+
+    [Fact]
+    public async Task UpdatePostLinkedInDateAsync_WritesNonAsciiTextUnescaped()
+    {
+        // Arrange - a hook with an em dash (BMP) and an emoji (outside the BMP)
+        var blogService = CreateServiceWithTempContent(out var contentRoot);
+        var postsJsonPath = Path.Combine(contentRoot, "Content", "posts.json");
+        var original = await File.ReadAllTextAsync(postsJsonPath);
+        await File.WriteAllTextAsync(postsJsonPath, original.Replace(
+            "\"image\": null",
+            "\"image\": null, \"linkedInHook\": \"Measure first \u2014 then optimize \U0001F525\""));
+
+        // Act
+        var result = await blogService.UpdatePostLinkedInDateAsync("test-post-computers", new DateTime(2026, 3, 1));
+        var saved = await File.ReadAllTextAsync(postsJsonPath);
+
+        // Assert
+        Assert.True(result);
+        Assert.Contains("Measure first \u2014 then optimize", saved);
+        Assert.DoesNotContain("\\u2014", saved);
+        // The relaxed encoder still escapes surrogate pairs, so emoji stay as \uXXXX pairs
+        Assert.Contains("\\uD83D\\uDD25", saved);
+
+        var reloaded = await CreateServiceFor(contentRoot).GetPostBySlugAsync("test-post-computers");
+        Assert.Equal("Measure first \u2014 then optimize \U0001F525", reloaded?.LinkedInHook);
+    }
 }
@@ -318,7 +318,7 @@ public class AdminController : Controller
     }
 
     [HttpGet("download-posts-json")]
-    public async Task<IActionResult> DownloadPostsJson()
+    public IActionResult DownloadPostsJson()
     {
         if (!IsAuthorized())
         {
@@ -331,11 +331,19 @@ public class AdminController : Controller
             return NotFound("posts.json not found");
         }
 
-        var json = await System.IO.File.ReadAllTextAsync(postsJsonPath);
         var timestamp = DateTime.Now.ToString("yyyyMMdd-HHmmss");
         var fileName = $"posts-{timestamp}.json";
 
-        return File(System.Text.Encoding.UTF8.GetBytes(json), "application/json", fileName);
+        // Always revalidate: a heuristically cached copy could hand back posts.json from
+        // before a reschedule. The validators turn an unchanged re-download into a 304.
+        Response.Headers.CacheControl = "private, no-cache";
+        var fileInfo = new FileInfo(postsJsonPath);
+        var lastModified = new DateTimeOffset(fileInfo.LastWriteTimeUtc);
+        var entityTag = new Microsoft.Net.Http.Headers.EntityTagHeaderValue(
+            $"\"{fileInfo.LastWriteTimeUtc.Ticks:x}-{fileInfo.Length:x}\"");
+
+        // Stream the file as-is rather than decoding it to a string and re-encoding it
+        return PhysicalFile(postsJsonPath, "application/json; charset=utf-8", fileName, lastModified, entityTag);
     }
 
     // Instagram Integration
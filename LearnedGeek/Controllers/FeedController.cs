@@ -21,9 +21,8 @@ public class FeedController : Controller
         var baseUrl = "https://learnedgeek.com";
         var posts = await _blogService.GetAllPostsAsync();
 
-        // Get the 20 most recent posts
+        // Get the 20 most recent posts (GetAllPostsAsync already returns newest first)
         var recentPosts = posts
-            .OrderByDescending(p => p.Date)
             .Take(20)
             .ToList();
 
@@ -59,7 +58,7 @@ public class FeedController : Controller
             )
         );
 
-        return Content(rss.ToString(), "application/rss+xml", Encoding.UTF8);
+        return Content(rss.ToString(SaveOptions.DisableFormatting), "application/rss+xml", Encoding.UTF8);
     }
 
     [Route("feed.json")]
@@ -70,7 +69,6 @@ public class FeedController : Controller
         var posts = await _blogService.GetAllPostsAsync();
 
         var recentPosts = posts
-            .OrderByDescending(p => p.Date)
             .Take(20)
             .ToList();
 
@@ -51,7 +51,7 @@ public class SitemapController : Controller
             ));
         }
 
-        return Content(sitemap.ToString(), "application/xml", Encoding.UTF8);
+        return Content(sitemap.ToString(SaveOptions.DisableFormatting), "application/xml", Encoding.UTF8);
     }
 
     private static XElement CreateUrlElement(XNamespace ns, string loc, string changefreq, string priority, DateTime? lastmod = null)
@@ -1,3 +1,5 @@
+using System.Text.Json.Serialization;
+
 namespace LearnedGeek.Models;
 
 public class BlogPost
@@ -15,6 +17,10 @@ public class BlogPost
     public string? BlueskyHook { get; set; }
     public string? InstagramCaption { get; set; }
     public DateTime? InstagramPostedDate { get; set; }
+
+    // Loaded from the markdown file on view; never part of posts.json
+    [JsonIgnore]
     public string? Content { get; set; }
+    [JsonIgnore]
     public string? HtmlContent { get; set; }
 }
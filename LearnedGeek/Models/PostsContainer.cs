@@ -0,0 +1,6 @@
+namespace LearnedGeek.Models;
+
+public class PostsContainer
+{
+    public List<BlogPost> Posts { get; set; } = [];
+}
@@ -0,0 +1,13 @@
+using System.Text.Json.Serialization;
+using LearnedGeek.Models;
+
+namespace LearnedGeek.Services;
+
+/// <summary>
+/// Compile-time serialization metadata for posts.json, so reading and saving posts
+/// uses generated accessors for BlogPost instead of runtime reflection.
+/// </summary>
+[JsonSerializable(typeof(PostsContainer))]
+internal partial class BlogJsonContext : JsonSerializerContext
+{
+}
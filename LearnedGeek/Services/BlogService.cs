@@ -1,3 +1,4 @@
+using System.Text.Encodings.Web;
 using System.Text.Json;
 using System.Text.Json.Serialization;
 using LearnedGeek.Models;
@@ -11,9 +12,26 @@ public class BlogService : IBlogService
     private readonly string _contentPath;
     private readonly MarkdownPipeline _markdownPipeline;
     private List<BlogPost>? _postsCache;
+    private List<BlogPost>? _postsByDateCache;
     private readonly JsonSerializerOptions _jsonOptions;
     private readonly ILogger<BlogService> _logger;
 
+    private static readonly Comparer<BlogPost> PostDateDescending =
+        Comparer<BlogPost>.Create((a, b) => b.Date.CompareTo(a.Date));
+
+    // Shared so System.Text.Json builds its serialization metadata once, not on every save
+    private static readonly JsonSerializerOptions WriteOptions = new()
+    {
+        WriteIndented = true,
+        PropertyNamingPolicy = JsonNamingPolicy.CamelCase,
+        Converters = { new JsonStringEnumConverter(JsonNamingPolicy.CamelCase) },
+        DefaultIgnoreCondition = JsonIgnoreCondition.WhenWritingNull,
+        TypeInfoResolver = BlogJsonContext.Default,
+        // Write em dashes, arrows etc. as raw UTF-8 like the hand-edited file and the
+        // SEO scripts do, instead of the default encoder's \uXXXX escapes
+        Encoder = JavaScriptEncoder.UnsafeRelaxedJsonEscaping
+    };
+
     public BlogService(IWebHostEnvironment env, ILogger<BlogService> logger)
     {
         _contentPath = Path.Combine(env.ContentRootPath, "Content");
@@ -23,7 +41,8 @@ public class BlogService : IBlogService
         _jsonOptions = new JsonSerializerOptions
         {
             PropertyNameCaseInsensitive = true,
-            Converters = { new JsonStringEnumConverter() }
+            Converters = { new JsonStringEnumConverter() },
+            TypeInfoResolver = BlogJsonContext.Default
         };
         _logger = logger;
     }
@@ -43,8 +62,9 @@ public class BlogService : IBlogService
 
         try
         {
-            var json = await File.ReadAllTextAsync(postsJsonPath);
-            var postsData = JsonSerializer.Deserialize<PostsContainer>(json, _jsonOptions);
+            // Deserialize straight from the UTF-8 file stream instead of decoding it to a string first
+            await using var stream = File.OpenRead(postsJsonPath);
+            var postsData = await JsonSerializer.DeserializeAsync<PostsContainer>(stream, _jsonOptions);
             _postsCache = postsData?.Posts ?? [];
 
             _logger.LogInformation("Successfully loaded {Count} blog posts from posts.json", _postsCache.Count);
@@ -69,26 +89,34 @@ public class BlogService : IBlogService
         }
     }
 
-    public async Task<IEnumerable<BlogPost>> GetAllPostsAsync()
+    // posts.json is kept in authoring order, so sort once per load and let the
+    // listing queries filter the already-ordered list instead of re-sorting per call.
+    private async Task<List<BlogPost>> LoadPostsByDateAsync()
     {
+        if (_postsByDateCache != null)
+            return _postsByDateCache;
+
         var posts = await LoadPostsMetadataAsync();
-        return posts
-            .Where(p => p.Date.Date <= DateTime.Today)
-            .OrderByDescending(p => p.Date);
+        _postsByDateCache = posts.OrderByDescending(p => p.Date).ToList();
+        return _postsByDateCache;
+    }
+
+    public async Task<IEnumerable<BlogPost>> GetAllPostsAsync()
+    {
+        var posts = await LoadPostsByDateAsync();
+        return posts.Where(p => p.Date.Date <= DateTime.Today);
     }
 
     public async Task<IEnumerable<BlogPost>> GetAllPostsIncludingFutureAsync()
     {
-        var posts = await LoadPostsMetadataAsync();
-        return posts.OrderByDescending(p => p.Date);
+        var posts = await LoadPostsByDateAsync();
+        return posts.AsReadOnly();
     }
 
     public async Task<IEnumerable<BlogPost>> GetPostsByCategoryAsync(Category category)
     {
-        var posts = await LoadPostsMetadataAsync();
-        return posts
-            .Where(p => p.Category == category && p.Date.Date <= DateTime.Today)
-            .OrderByDescending(p => p.Date);
+        var posts = await LoadPostsByDateAsync();
+        return posts.Where(p => p.Category == category && p.Date.Date <= DateTime.Today);
     }
 
     public async Task<BlogPost?> GetPostBySlugAsync(string slug)
@@ -113,10 +141,8 @@ public class BlogService : IBlogService
 
     public async Task<IEnumerable<BlogPost>> GetFeaturedPostsAsync()
     {
-        var posts = await LoadPostsMetadataAsync();
-        return posts
-            .Where(p => p.Featured && p.Date.Date <= DateTime.Today)
-            .OrderByDescending(p => p.Date);
+        var posts = await LoadPostsByDateAsync();
+        return posts.Where(p => p.Featured && p.Date.Date <= DateTime.Today);
     }
 
     public async Task<Dictionary<string, int>> GetTagCountsAsync()
@@ -131,11 +157,9 @@ public class BlogService : IBlogService
 
     public async Task<IEnumerable<BlogPost>> GetPostsByTagAsync(string tag)
     {
-        var posts = await LoadPostsMetadataAsync();
-        return posts
-            .Where(p => p.Date.Date <= DateTime.Today &&
-                        p.Tags.Any(t => t.Equals(tag, StringComparison.OrdinalIgnoreCase)))
-            .OrderByDescending(p => p.Date);
+        var posts = await LoadPostsByDateAsync();
+        return posts.Where(p => p.Date.Date <= DateTime.Today &&
+                                p.Tags.Any(t => t.Equals(tag, StringComparison.OrdinalIgnoreCase)));
     }
 
     public async Task<bool> UpdatePostLinkedInDateAsync(string slug, DateTime postedDate)
@@ -149,23 +173,7 @@ public class BlogService : IBlogService
 
         post.LinkedInPostedDate = postedDate;
 
-        // Save back to posts.json
-        var postsJsonPath = Path.Combine(_contentPath, "posts.json");
-        var writeOptions = new JsonSerializerOptions
-        {
-            WriteIndented = true,
-            PropertyNamingPolicy = JsonNamingPolicy.CamelCase,
-            Converters = { new JsonStringEnumConverter(JsonNamingPolicy.CamelCase) },
-            DefaultIgnoreCondition = JsonIgnoreCondition.WhenWritingNull
-        };
-
-        var container = new PostsContainer { Posts = posts };
-        var json = JsonSerializer.Serialize(container, writeOptions);
-        await File.WriteAllTextAsync(postsJsonPath, json);
-
-        // Clear cache to ensure fresh data on next load
-        _postsCache = null;
-
+        await SavePostsAsync(posts);
         return true;
     }
 
@@ -195,6 +203,10 @@ public class BlogService : IBlogService
 
         post.Date = newDate;
 
+        // The date is already changed on the cached object, so fix the ordered view
+        // before saving; a failed write must not leave the listings misordered
+        RepositionByDate(post);
+
         await SavePostsAsync(posts);
         return true;
     }
@@ -210,15 +222,20 @@ public class BlogService : IBlogService
     public async Task<bool> UpdatePostDatesAsync(Dictionary<string, DateTime> slugDates)
     {
         var posts = await LoadPostsMetadataAsync();
+        var postsBySlug = new Dictionary<string, BlogPost>(StringComparer.OrdinalIgnoreCase);
+        foreach (var post in posts)
+            postsBySlug.TryAdd(post.Slug, post);
 
         foreach (var (slug, newDate) in slugDates)
         {
-            var post = posts.FirstOrDefault(p =>
-                string.Equals(p.Slug, slug, StringComparison.OrdinalIgnoreCase));
-            if (post != null)
+            if (postsBySlug.TryGetValue(slug, out var post))
                 post.Date = newDate;
         }
 
+        // Several dates moved at once, so re-sort lazily on the next read. Cleared
+        // before saving so a failed write can't leave a stale order behind.
+        _postsByDateCache = null;
+
         await SavePostsAsync(posts);
         return true;
     }
@@ -226,23 +243,27 @@ public class BlogService : IBlogService
     private async Task SavePostsAsync(List<BlogPost> posts)
     {
         var postsJsonPath = Path.Combine(_contentPath, "posts.json");
-        var writeOptions = new JsonSerializerOptions
-        {
-            WriteIndented = true,
-            PropertyNamingPolicy = JsonNamingPolicy.CamelCase,
-            Converters = { new JsonStringEnumConverter(JsonNamingPolicy.CamelCase) },
-            DefaultIgnoreCondition = JsonIgnoreCondition.WhenWritingNull
-        };
-
         var container = new PostsContainer { Posts = posts };
-        var json = JsonSerializer.Serialize(container, writeOptions);
-        await File.WriteAllTextAsync(postsJsonPath, json);
+        var json = JsonSerializer.SerializeToUtf8Bytes(container, WriteOptions);
+        await File.WriteAllBytesAsync(postsJsonPath, json);
 
-        _postsCache = null;
+        // The cache already holds exactly what was written, so keep it rather than
+        // re-reading the file. Callers that change dates fix up the date-ordered view.
+        _postsCache = posts;
     }
 
-    private class PostsContainer
+    // Moves a re-dated post to its new slot with a binary search instead of
+    // re-sorting every post. Builds a new list because requests may still be
+    // enumerating the previous one.
+    private void RepositionByDate(BlogPost post)
     {
-        public List<BlogPost> Posts { get; set; } = [];
+        if (_postsByDateCache == null)
+            return;
+
+        var reordered = new List<BlogPost>(_postsByDateCache);
+        reordered.Remove(post);
+        var index = reordered.BinarySearch(post, PostDateDescending);
+        reordered.Insert(index < 0 ? ~index : index, post);
+        _postsByDateCache = reordered;
     }
 }
@@ -16,8 +16,8 @@
  *   GOOGLE_CSE_ID — Programmable Search Engine ID
  */
 
-import { loadPosts, getMarkdownPath, fileExists } from './lib/posts.mjs';
-import { readMarkdown, extractHeadings } from './lib/markdown.mjs';
+import { loadPosts, getMarkdownPath } from './lib/posts.mjs';
+import { readMarkdownIfExists, extractHeadings } from './lib/markdown.mjs';
 
 const args = process.argv.slice(2);
 const urlsIdx = args.indexOf('--urls');
@@ -184,13 +184,12 @@ async function main() {
   console.log('Competitive Heading Analysis\n');
 
   // Load local post headings
-  const mdPath = getMarkdownPath(slug);
-  if (!(await fileExists(mdPath))) {
+  const content = await readMarkdownIfExists(getMarkdownPath(slug));
+  if (content === null) {
     console.error(`ERROR: Post markdown not found: ${slug}.md`);
     process.exit(1);
   }
 
-  const content = await readMarkdown(mdPath);
   const localHeadings = extractHeadings(content);
 
   console.log(`  Local post: ${slug}`);
@@ -10,8 +10,8 @@
  *   node scripts/seo/internal-links.mjs --json            # Machine-readable output
  */
 
-import { loadPosts, getMarkdownPath, fileExists } from './lib/posts.mjs';
-import { readMarkdown, extractInternalLinks } from './lib/markdown.mjs';
+import { loadPosts, getMarkdownPath, buildTagSets, getTagOverlap } from './lib/posts.mjs';
+import { readMarkdownIfExists, extractInternalLinks } from './lib/markdown.mjs';
 
 const args = process.argv.slice(2);
 const jsonOutput = args.includes('--json');
@@ -20,40 +20,37 @@ const minTags = minTagsIdx !== -1 ? parseInt(args[minTagsIdx + 1], 10) : 2;
 const slugIdx = args.indexOf('--slug');
 const filterSlug = slugIdx !== -1 ? args[slugIdx + 1] : null;
 
-async function buildLinkGraph(posts) {
-  const graph = new Map(); // slug -> Set of linked slugs
+async function getOutboundLinks(slug) {
+  const outbound = new Set();
 
-  for (const post of posts) {
-    const mdPath = getMarkdownPath(post.slug);
-    const outbound = new Set();
-
-    if (await fileExists(mdPath)) {
-      try {
-        const content = await readMarkdown(mdPath);
-        const links = extractInternalLinks(content);
-        for (const link of links) {
-          outbound.add(link.slug);
-        }
-      } catch {
-        // Skip unreadable files
+  try {
+    const content = await readMarkdownIfExists(getMarkdownPath(slug));
+    if (content !== null) {
+      for (const link of extractInternalLinks(content)) {
+        outbound.add(link.slug);
       }
     }
-
-    graph.set(post.slug, outbound);
+  } catch {
+    // Skip unreadable files
   }
 
-  return graph;
+  return outbound;
 }
 
-function getTagOverlap(tagsA, tagsB) {
-  const setB = new Set(tagsB.map(t => t.toLowerCase()));
-  return tagsA.filter(t => setB.has(t.toLowerCase()));
+async function buildLinkGraph(posts) {
+  // Read all markdown files concurrently rather than one await at a time
+  const outboundSets = await Promise.all(posts.map(p => getOutboundLinks(p.slug)));
+
+  const graph = new Map(); // slug -> Set of linked slugs
+  posts.forEach((post, i) => graph.set(post.slug, outboundSets[i]));
+  return graph;
 }
 
 async function main() {
   const posts = await loadPosts();
   const postMap = new Map(posts.map(p => [p.slug, p]));
   const graph = await buildLinkGraph(posts);
+  const tagSets = buildTagSets(posts);
 
   const suggestions = [];
   const orphans = []; // No outbound links
@@ -93,7 +90,7 @@ async function main() {
 
       if (alreadyLinked) continue;
 
-      const overlap = getTagOverlap(postA.tags || [], postB.tags || []);
+      const overlap = getTagOverlap(postA.tags || [], tagSets.get(postB.slug));
 
       if (overlap.length >= minTags) {
         // Check if B links to A (bidirectional awareness)
@@ -1,7 +1,13 @@
 import { readFile } from 'node:fs/promises';
 
-export async function readMarkdown(filePath) {
-  return readFile(filePath, 'utf-8');
+// One read instead of an access() check followed by a read; null when the file is missing
+export async function readMarkdownIfExists(filePath) {
+  try {
+    return await readFile(filePath, 'utf-8');
+  } catch (err) {
+    if (err.code === 'ENOENT') return null;
+    throw err;
+  }
 }
 
 export function extractInternalLinks(markdownContent) {
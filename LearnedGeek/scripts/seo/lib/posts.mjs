@@ -1,4 +1,4 @@
-import { readFile, access } from 'node:fs/promises';
+import { readFile, writeFile, rename, access } from 'node:fs/promises';
 import { join, dirname } from 'node:path';
 import { fileURLToPath } from 'node:url';
 
@@ -7,18 +7,65 @@ const __dirname = dirname(fileURLToPath(import.meta.url));
 const PROJECT_ROOT = join(__dirname, '..', '..', '..');
 const CONTENT_ROOT = join(__dirname, '..', '..', '..', 'Content');
 const WWWROOT = join(__dirname, '..', '..', '..', 'wwwroot');
+const POSTS_JSON = join(CONTENT_ROOT, 'posts.json');
 
-export { PROJECT_ROOT, CONTENT_ROOT, WWWROOT };
+export { PROJECT_ROOT, CONTENT_ROOT, WWWROOT, POSTS_JSON };
+
+// Full posts.json document ({ posts: [...] }) for scripts that modify it
+export async function loadPostsData() {
+  const raw = await readFile(POSTS_JSON, 'utf-8');
+  return JSON.parse(raw);
+}
+
+// Serializes once and swaps the file into place with a rename, so an
+// interrupted write can never leave a truncated posts.json behind.
+// Formatting matches BlogService's writer (2-space indent, no trailing newline).
+// Returns false without touching the file when the content is unchanged.
+export async function savePostsData(data) {
+  const json = JSON.stringify(data, null, 2);
+  const current = await readFile(POSTS_JSON, 'utf-8').catch(() => null);
+  if (current === json) return false;
+
+  const tmpPath = `${POSTS_JSON}.tmp`;
+  await writeFile(tmpPath, json, 'utf-8');
+  await rename(tmpPath, POSTS_JSON);
+  return true;
+}
 
 export async function loadPosts({ includeScheduled = false } = {}) {
-  const raw = await readFile(join(CONTENT_ROOT, 'posts.json'), 'utf-8');
-  const { posts } = JSON.parse(raw);
+  const { posts } = await loadPostsData();
 
   if (includeScheduled) return posts;
 
-  const today = new Date();
-  today.setHours(23, 59, 59, 999);
-  return posts.filter(p => new Date(p.date) <= today);
+  const today = getTodayDateString();
+  return posts.filter(p => {
+    const day = getPostDateString(p);
+    return day !== '' && day <= today;
+  });
+}
+
+// posts.json dates are ISO "YYYY-MM-DD[THH:mm:ss]", so comparing the date prefix
+// as a string gives chronological order without parsing every entry into a Date.
+export function getTodayDateString() {
+  const now = new Date();
+  const month = String(now.getMonth() + 1).padStart(2, '0');
+  const day = String(now.getDate()).padStart(2, '0');
+  return `${now.getFullYear()}-${month}-${day}`;
+}
+
+// Undated posts yield '' (earlier than any real date) instead of throwing;
+// validate-posts reports them as errors.
+export function getPostDateString(post) {
+  return typeof post.date === 'string' ? post.date.slice(0, 10) : '';
+}
+
+// Lowercased tag sets keyed by slug, built once per post instead of once per compared pair
+export function buildTagSets(posts) {
+  return new Map(posts.map(p => [p.slug, new Set((p.tags || []).map(t => t.toLowerCase()))]));
+}
+
+export function getTagOverlap(tagsA, tagSetB) {
+  return tagsA.filter(t => tagSetB.has(t.toLowerCase()));
 }
 
 export function getMarkdownPath(slug) {
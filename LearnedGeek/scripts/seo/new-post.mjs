@@ -14,9 +14,8 @@
  *   - Runs tag suggestions and link suggestions automatically
  */
 
-import { readFile, writeFile } from 'node:fs/promises';
-import { join } from 'node:path';
-import { loadPosts, getMarkdownPath, CONTENT_ROOT, VALID_CATEGORIES } from './lib/posts.mjs';
+import { writeFile } from 'node:fs/promises';
+import { loadPostsData, savePostsData, getMarkdownPath, buildTagSets, getTagOverlap, VALID_CATEGORIES } from './lib/posts.mjs';
 
 const args = process.argv.slice(2);
 
@@ -45,11 +44,6 @@ function buildTagVocabulary(posts) {
   return tagCounts;
 }
 
-function getTagOverlap(tagsA, tagsB) {
-  const setB = new Set(tagsB.map(t => t.toLowerCase()));
-  return tagsA.filter(t => setB.has(t.toLowerCase()));
-}
-
 async function main() {
   const title = getArg('title');
   const category = getArg('category');
@@ -86,9 +80,7 @@ async function main() {
   console.log('');
 
   // Load existing posts
-  const postsJsonPath = join(CONTENT_ROOT, 'posts.json');
-  const raw = await readFile(postsJsonPath, 'utf-8');
-  const postsData = JSON.parse(raw);
+  const postsData = await loadPostsData();
   const existingPosts = postsData.posts;
 
   // Check for slug collision
@@ -154,7 +146,7 @@ async function main() {
   // Insert at the top of the posts array (newest first)
   postsData.posts.unshift(newPost);
 
-  await writeFile(postsJsonPath, JSON.stringify(postsData, null, 2), 'utf-8');
+  await savePostsData(postsData);
   console.log('  Updated: Content/posts.json\n');
 
   // --- Link Suggestions ---
@@ -162,9 +154,10 @@ async function main() {
     console.log('=== Suggested Cross-Links ===\n');
     console.log('  Add these to your post where relevant:\n');
 
+    const tagSets = buildTagSets(existingPosts);
     const suggestions = [];
     for (const other of existingPosts) {
-      const overlap = getTagOverlap(tags, other.tags || []);
+      const overlap = getTagOverlap(tags, tagSets.get(other.slug));
       if (overlap.length >= 2) {
         suggestions.push({
           slug: other.slug,
@@ -14,12 +14,9 @@
  *   { "startDate": "2026-03-06", "intervalDays": 3, "order": ["slug1", "slug2", ...] }
  */
 
-import { readFile, writeFile } from 'node:fs/promises';
-import { join, dirname } from 'node:path';
-import { fileURLToPath } from 'node:url';
-
-const __dirname = dirname(fileURLToPath(import.meta.url));
-const POSTS_JSON = join(__dirname, '..', '..', 'Content', 'posts.json');
+import { readFile } from 'node:fs/promises';
+import { join } from 'node:path';
+import { loadPostsData, savePostsData, getTodayDateString, getPostDateString } from './lib/posts.mjs';
 
 const args = process.argv.slice(2);
 const dryRun = args.includes('--dry-run');
@@ -35,8 +32,7 @@ const planPath = args[planIdx + 1].startsWith('/')
   : join(process.cwd(), args[planIdx + 1]);
 
 async function main() {
-  const raw = await readFile(POSTS_JSON, 'utf-8');
-  const data = JSON.parse(raw);
+  const data = await loadPostsData();
 
   const plan = JSON.parse(await readFile(planPath, 'utf-8'));
   const { startDate, intervalDays, order } = plan;
@@ -56,12 +52,12 @@ async function main() {
   }
 
   // Check for slugs in posts.json not in plan
-  const today = new Date();
-  today.setHours(23, 59, 59, 999);
+  const today = getTodayDateString();
   const scheduledSlugs = new Set(
-    data.posts.filter(p => new Date(p.date) > today).map(p => p.slug)
+    data.posts.filter(p => getPostDateString(p) > today).map(p => p.slug)
   );
-  const unplanned = [...scheduledSlugs].filter(s => !order.includes(s));
+  const plannedSlugs = new Set(order);
+  const unplanned = [...scheduledSlugs].filter(s => !plannedSlugs.has(s));
   if (unplanned.length > 0) {
     console.warn(`WARN: ${unplanned.length} scheduled post(s) not in plan (will keep existing dates):`);
     unplanned.forEach(s => console.warn(`  - ${s}`));
@@ -96,8 +92,11 @@ async function main() {
   console.log(`\n  ${changedCount} date(s) changed. Queue ends: ${lastDate}\n`);
 
   if (!dryRun) {
-    await writeFile(POSTS_JSON, JSON.stringify(data, null, 2) + '\n', 'utf-8');
-    console.log(`  ✓ posts.json updated.\n`);
+    if (await savePostsData(data)) {
+      console.log(`  ✓ posts.json updated.\n`);
+    } else {
+      console.log('  posts.json already matches the plan — nothing written.\n');
+    }
   } else {
     console.log('  (Dry run — no changes written. Remove --dry-run to apply.)\n');
   }
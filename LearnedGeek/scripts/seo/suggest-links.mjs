@@ -9,8 +9,8 @@
  *   node scripts/seo/suggest-links.mjs --min-tags 3        # Require 3+ shared tags
  */
 
-import { loadPosts, getMarkdownPath, fileExists } from './lib/posts.mjs';
-import { readMarkdown, extractInternalLinks } from './lib/markdown.mjs';
+import { loadPosts, getMarkdownPath, buildTagSets, getTagOverlap } from './lib/posts.mjs';
+import { readMarkdownIfExists, extractInternalLinks } from './lib/markdown.mjs';
 
 const args = process.argv.slice(2);
 const slugIdx = args.indexOf('--slug');
@@ -19,20 +19,15 @@ const minTagsIdx = args.indexOf('--min-tags');
 const minTags = minTagsIdx !== -1 ? parseInt(args[minTagsIdx + 1], 10) : 2;
 
 async function getExistingLinks(slug) {
-  const mdPath = getMarkdownPath(slug);
-  if (!(await fileExists(mdPath))) return new Set();
-  const content = await readMarkdown(mdPath);
+  const content = await readMarkdownIfExists(getMarkdownPath(slug));
+  if (content === null) return new Set();
   return new Set(extractInternalLinks(content).map(l => l.slug));
 }
 
-function getTagOverlap(tagsA, tagsB) {
-  const setB = new Set(tagsB.map(t => t.toLowerCase()));
-  return tagsA.filter(t => setB.has(t.toLowerCase()));
-}
-
 async function main() {
   const posts = await loadPosts({ includeScheduled: true });
   const postMap = new Map(posts.map(p => [p.slug, p]));
+  const tagSets = buildTagSets(posts);
 
   const postsToCheck = filterSlug
     ? posts.filter(p => p.slug === filterSlug)
@@ -45,15 +40,18 @@ async function main() {
 
   let totalSuggestions = 0;
 
-  for (const post of postsToCheck) {
-    const existingLinks = await getExistingLinks(post.slug);
+  // Read all markdown files concurrently; output below still goes in post order
+  const existingLinksBySlug = await Promise.all(postsToCheck.map(p => getExistingLinks(p.slug)));
+
+  for (const [i, post] of postsToCheck.entries()) {
+    const existingLinks = existingLinksBySlug[i];
     const suggestions = [];
 
     for (const other of posts) {
       if (other.slug === post.slug) continue;
       if (existingLinks.has(other.slug)) continue;
 
-      const overlap = getTagOverlap(post.tags || [], other.tags || []);
+      const overlap = getTagOverlap(post.tags || [], tagSets.get(other.slug));
       if (overlap.length >= minTags) {
         suggestions.push({
           slug: other.slug,
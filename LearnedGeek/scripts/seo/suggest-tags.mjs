@@ -9,8 +9,8 @@
  *   node scripts/seo/suggest-tags.mjs --list                   # Show all existing tags with usage counts
  */
 
-import { loadPosts, getMarkdownPath, fileExists } from './lib/posts.mjs';
-import { readMarkdown } from './lib/markdown.mjs';
+import { loadPosts, getMarkdownPath } from './lib/posts.mjs';
+import { readMarkdownIfExists } from './lib/markdown.mjs';
 
 const args = process.argv.slice(2);
 const slugIdx = args.indexOf('--slug');
@@ -130,10 +130,7 @@ async function main() {
       label = slug;
     }
 
-    const mdPath = getMarkdownPath(slug);
-    if (await fileExists(mdPath)) {
-      text += await readMarkdown(mdPath);
-    }
+    text += (await readMarkdownIfExists(getMarkdownPath(slug))) ?? '';
 
     if (!text.trim()) {
       console.error(`No content found for slug: ${slug}`);
@@ -12,12 +12,8 @@
  *   node scripts/seo/trim-descriptions.mjs --slug foo  # Single post
  */
 
-import { readFile, writeFile } from 'node:fs/promises';
-import { join, dirname } from 'node:path';
-import { fileURLToPath } from 'node:url';
+import { loadPostsData, savePostsData } from './lib/posts.mjs';
 
-const __dirname = dirname(fileURLToPath(import.meta.url));
-const POSTS_JSON = join(__dirname, '..', '..', 'Content', 'posts.json');
 const MAX_LENGTH = 160;
 
 const args = process.argv.slice(2);
@@ -74,8 +70,7 @@ function smartTrim(text, maxLen = MAX_LENGTH) {
 }
 
 async function main() {
-  const raw = await readFile(POSTS_JSON, 'utf-8');
-  const data = JSON.parse(raw);
+  const data = await loadPostsData();
 
   let changed = 0;
   const changes = [];
@@ -107,7 +102,7 @@ async function main() {
   }
 
   if (!dryRun && changed > 0) {
-    await writeFile(POSTS_JSON, JSON.stringify(data, null, 2) + '\n', 'utf-8');
+    await savePostsData(data);
     console.log(`✓ Updated ${changed} descriptions in posts.json\n`);
   } else if (dryRun) {
     console.log('(No changes written — remove --dry-run to apply)\n');
@@ -10,10 +10,12 @@
 
 import { execSync } from 'node:child_process';
 import { loadPosts, getMarkdownPath, getImagePath, fileExists, VALID_CATEGORIES } from './lib/posts.mjs';
-import { readMarkdown, extractInternalLinks } from './lib/markdown.mjs';
+import { readMarkdownIfExists, extractInternalLinks } from './lib/markdown.mjs';
 
 const SLUG_PATTERN = /^[a-z0-9-]+$/;
 const TAG_PATTERN = /^[a-z0-9-]+$/;
+// loadPosts and reschedule compare the YYYY-MM-DD prefix as a string, so dates must be ISO
+const DATE_PATTERN = /^\d{4}-\d{2}-\d{2}(T|$)/;
 const MIN_DESCRIPTION_LENGTH = 50;
 const MAX_DESCRIPTION_LENGTH = 160;
 
@@ -45,13 +47,15 @@ function getStagedFiles() {
 async function main() {
   console.log('Validating blog posts...\n');
 
-  const allPosts = await loadPosts({ includeScheduled: true });
-  let postsToValidate = allPosts;
+  // Check the staged file list before touching posts.json, so the pre-commit hook
+  // doesn't read and parse the whole file for commits that don't involve posts.
+  let postsJsonStaged = false;
+  let stagedMdSlugs = [];
 
   if (stagedOnly) {
     const staged = getStagedFiles();
-    const postsJsonStaged = staged.some(f => f.includes('posts.json'));
-    const stagedMdSlugs = staged
+    postsJsonStaged = staged.some(f => f.includes('posts.json'));
+    stagedMdSlugs = staged
       .filter(f => f.match(/Content\/posts\/[^/]+\.md$/))
       .map(f => f.match(/([^/]+)\.md$/)?.[1])
       .filter(Boolean);
@@ -60,12 +64,18 @@ async function main() {
       console.log('No blog-related files staged. Skipping validation.\n');
       process.exit(0);
     }
+  }
 
+  const allPosts = await loadPosts({ includeScheduled: true });
+  let postsToValidate = allPosts;
+
+  if (stagedOnly) {
     if (postsJsonStaged) {
       // Validate all posts since the JSON itself changed
       console.log('posts.json is staged — validating all entries.\n');
     } else {
-      postsToValidate = allPosts.filter(p => stagedMdSlugs.includes(p.slug));
+      const stagedSlugSet = new Set(stagedMdSlugs);
+      postsToValidate = allPosts.filter(p => stagedSlugSet.has(p.slug));
       console.log(`Validating ${postsToValidate.length} staged post(s).\n`);
     }
   }
@@ -88,7 +98,17 @@ async function main() {
   // --- Per-post validation ---
   const allSlugs = new Set(allPosts.map(p => p.slug));
 
-  for (const post of postsToValidate) {
+  // Do the file I/O for every post concurrently up front; the report below
+  // still prints in post order. Read failures other than a missing file are kept
+  // as the Error so they're reported as such rather than as "missing".
+  const [markdownContents, imagesExist] = await Promise.all([
+    Promise.all(postsToValidate.map(p =>
+      p.slug ? readMarkdownIfExists(getMarkdownPath(p.slug)).catch(err => err) : null)),
+    Promise.all(postsToValidate.map(p =>
+      p.image ? fileExists(getImagePath(p.image)) : true))
+  ]);
+
+  for (const [i, post] of postsToValidate.entries()) {
     console.log(`  [${post.slug}]`);
 
     // Required fields
@@ -113,7 +133,9 @@ async function main() {
     }
 
     if (!post.date) error('Missing date');
-    else if (isNaN(new Date(post.date).getTime())) error(`Invalid date: "${post.date}"`);
+    else if (!DATE_PATTERN.test(post.date) || isNaN(new Date(post.date).getTime())) {
+      error(`Invalid date: "${post.date}" (must be ISO YYYY-MM-DD or YYYY-MM-DDTHH:mm:ss)`);
+    }
 
     if (post.featured === undefined || post.featured === null) error('Missing featured flag');
 
@@ -130,34 +152,23 @@ async function main() {
       if (len > MAX_DESCRIPTION_LENGTH) warn(`Description too long (${len} chars, recommend ${MIN_DESCRIPTION_LENGTH}-${MAX_DESCRIPTION_LENGTH})`);
     }
 
-    // File existence
+    // File existence + internal link validation (check that linked slugs exist)
     if (post.slug) {
-      const mdPath = getMarkdownPath(post.slug);
-      if (!(await fileExists(mdPath))) error(`Markdown file missing: ${post.slug}.md`);
-    }
-
-    if (post.image) {
-      const imgPath = getImagePath(post.image);
-      if (!(await fileExists(imgPath))) error(`Image file missing: ${post.image}`);
-    }
-
-    // Internal link validation (check that linked slugs exist)
-    if (post.slug) {
-      const mdPath = getMarkdownPath(post.slug);
-      if (await fileExists(mdPath)) {
-        try {
-          const content = await readMarkdown(mdPath);
-          const links = extractInternalLinks(content);
-          for (const link of links) {
-            if (!allSlugs.has(link.slug)) {
-              error(`Broken internal link in ${post.slug}.md: "/Blog/Post/${link.slug}" — slug not found in posts.json`);
-            }
+      const content = markdownContents[i];
+      if (content === null) {
+        error(`Markdown file missing: ${post.slug}.md`);
+      } else if (content instanceof Error) {
+        error(`Could not read ${post.slug}.md: ${content.code || content.message}`);
+      } else {
+        for (const link of extractInternalLinks(content)) {
+          if (!allSlugs.has(link.slug)) {
+            error(`Broken internal link in ${post.slug}.md: "/Blog/Post/${link.slug}" — slug not found in posts.json`);
           }
-        } catch {
-          // File read errors already caught by existence check
         }
       }
     }
+
+    if (post.image && !imagesExist[i]) error(`Image file missing: ${post.image}`);
   }
 
   // --- Summary ---
@@ -71,8 +71,12 @@ async function main() {
   console.log(`  Expected: ${STATIC_SITEMAP_URLS.length} static pages + ${posts.length} published posts = ${expectedUrls.size} URLs\n`);
 
   // Check for duplicate slugs that would create duplicate URLs
-  const slugs = posts.map(p => p.slug);
-  const duplicates = slugs.filter((s, i) => slugs.indexOf(s) !== i);
+  const seenSlugs = new Set();
+  const duplicates = [];
+  for (const { slug } of posts) {
+    if (seenSlugs.has(slug)) duplicates.push(slug);
+    else seenSlugs.add(slug);
+  }
   if (duplicates.length > 0) {
     error(`Duplicate slugs would create duplicate sitemap entries: ${duplicates.join(', ')}`);
   }
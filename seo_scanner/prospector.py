@@ -45,6 +45,11 @@ PLACE_DETAILS_API = "https://maps.googleapis.com/maps/api/place/details/json"
 REQUEST_TIMEOUT = 15
 DELAY_BETWEEN_CALLS = 0.5  # seconds — be polite to the API
 
+# Every geocode, Nearby Search page and Place Details lookup goes to
+# maps.googleapis.com, so one session keeps a single keep-alive connection
+# for the whole run instead of a new TCP + TLS handshake per place
+SESSION = requests.Session()
+
 # Google Place types most relevant for local SEO prospecting
 # https://developers.google.com/maps/documentation/places/web-service/supported_types
 COMMON_TYPES = [
@@ -105,7 +110,7 @@ def resolve_places_key(flag_value: str) -> str:
 def geocode_location(location_str: str, api_key: str) -> tuple[float, float] | None:
     """Convert a location string like 'Milwaukee, WI' to lat/lng."""
     try:
-        resp = requests.get(
+        resp = SESSION.get(
             GEOCODE_API,
             params={"address": location_str, "key": api_key},
             timeout=REQUEST_TIMEOUT,
@@ -135,7 +140,7 @@ def nearby_search_page(lat: float, lng: float, radius: int,
         params["pagetoken"] = page_token
 
     try:
-        resp = requests.get(NEARBY_SEARCH_API, params=params, timeout=REQUEST_TIMEOUT)
+        resp = SESSION.get(NEARBY_SEARCH_API, params=params, timeout=REQUEST_TIMEOUT)
         return resp.json()
     except Exception as e:
         print(f"  [WARN] Nearby search failed: {e}")
@@ -158,7 +163,7 @@ def fetch_place_details_lite(place_id: str, api_key: str) -> dict:
         "rating,user_ratings_total,editorial_summary"
     )
     try:
-        resp = requests.get(
+        resp = SESSION.get(
             PLACE_DETAILS_API,
             params={"place_id": place_id, "fields": fields, "key": api_key},
             timeout=REQUEST_TIMEOUT,
@@ -52,21 +52,38 @@ HEADERS = {
 }
 REQUEST_TIMEOUT = 15
 
+# Shared session: PageSpeed and the Places find/details calls go to the same two
+# Google hosts for every site in a --batch run, so those reuse keep-alive
+# connections. Client pages are each on their own host and gain nothing from it.
+SESSION = requests.Session()
+
 # Local SEO geographic keywords — extend with any cities in your target market
 LOCAL_GEO_PATTERNS = [
     r"\b(near me|in [a-z\s]+wi|wisconsin|milwaukee|madison|green bay|racine|kenosha|"
     r"waukesha|appleton|oshkosh|janesville|eau claire|west allis|sheboygan)\b"
 ]
 
+# Compiled once at import; the checks below run them against every scanned page
+GEO_RES      = [re.compile(p, re.IGNORECASE) for p in LOCAL_GEO_PATTERNS]
+PHONE_RE     = re.compile(r"(\(?\d{3}\)?[\s.\-]\d{3}[\s.\-]\d{4})")
+ADDRESS_RE   = re.compile(r"\d+\s+\w[\w\s]+,\s*\w[\w\s]+,?\s*[A-Z]{2}\s*\d{5}")
+ZIP_RE       = re.compile(r"\b(\d{5})\b")
+NON_DIGIT_RE = re.compile(r"\D")
+
 # ---------------------------------------------------------------------------
 # Fetching
 # ---------------------------------------------------------------------------
 
 def fetch_page(url: str):
     try:
-        resp = requests.get(url, headers=HEADERS, timeout=REQUEST_TIMEOUT)
+        resp = SESSION.get(url, headers=HEADERS, timeout=REQUEST_TIMEOUT)
         resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
+        # Hand over raw bytes so pages without a header charset are decoded from their
+        # <meta charset> rather than as ISO-8859-1; a charset the server declares
+        # in Content-Type still takes precedence, as it did with resp.text
+        content_type = resp.headers.get("Content-Type", "").lower()
+        declared = resp.encoding if "charset=" in content_type else None
+        soup = BeautifulSoup(resp.content, "html.parser", from_encoding=declared)
         return resp, soup
     except Exception as e:
         print(f"  [ERROR] Could not fetch {url}: {e}")
@@ -80,7 +97,7 @@ def fetch_pagespeed(url: str) -> dict:
             "strategy": "mobile",
             "category": ["performance", "seo", "best-practices"],
         }
-        resp = requests.get(PAGESPEED_API, params=params, timeout=30)
+        resp = SESSION.get(PAGESPEED_API, params=params, timeout=30)
         if resp.status_code == 200:
             return resp.json()
     except Exception as e:
@@ -96,7 +113,7 @@ def find_place_id(business_name: str, city: str, api_key: str) -> str | None:
     """Search for a Place ID by business name + city."""
     query = f"{business_name} {city}"
     try:
-        resp = requests.get(
+        resp = SESSION.get(
             PLACES_FIND_API,
             params={
                 "input": query,
@@ -123,7 +140,7 @@ def fetch_place_details(place_id: str, api_key: str) -> dict:
         "user_ratings_total,types,website,editorial_summary"
     )
     try:
-        resp = requests.get(
+        resp = SESSION.get(
             PLACES_DETAIL_API,
             params={"place_id": place_id, "fields": fields, "key": api_key},
             timeout=REQUEST_TIMEOUT,
@@ -271,8 +288,8 @@ def check_places(
 
     # NAP cross-check: phone
     if site_phone and result["phone"]:
-        site_digits = re.sub(r"\D", "", site_phone)
-        gbp_digits  = re.sub(r"\D", "", result["phone"])
+        site_digits = NON_DIGIT_RE.sub("", site_phone)
+        gbp_digits  = NON_DIGIT_RE.sub("", result["phone"])
         if site_digits and gbp_digits:
             if site_digits[-10:] == gbp_digits[-10:]:
                 result["nap_phone_match"] = True
@@ -287,8 +304,8 @@ def check_places(
 
     # NAP cross-check: address (zip code comparison)
     if site_address and result["address"]:
-        site_zip = re.search(r"\b(\d{5})\b", site_address)
-        gbp_zip  = re.search(r"\b(\d{5})\b", result["address"])
+        site_zip = ZIP_RE.search(site_address)
+        gbp_zip  = ZIP_RE.search(result["address"])
         if site_zip and gbp_zip:
             if site_zip.group(1) == gbp_zip.group(1):
                 result["nap_address_match"] = True
@@ -405,8 +422,8 @@ def check_schema(soup: BeautifulSoup) -> dict:
 
 def check_nap(soup: BeautifulSoup) -> dict:
     text = soup.get_text(" ", strip=True)
-    phone_match   = re.search(r"(\(?\d{3}\)?[\s.\-]\d{3}[\s.\-]\d{4})", text)
-    address_match = re.search(r"\d+\s+\w[\w\s]+,\s*\w[\w\s]+,?\s*[A-Z]{2}\s*\d{5}", text)
+    phone_match   = PHONE_RE.search(text)
+    address_match = ADDRESS_RE.search(text)
     issues = []
     if not phone_match:
         issues.append(
@@ -475,7 +492,7 @@ def check_geo_keywords(soup: BeautifulSoup) -> dict:
     h1_texts   = [h.get_text(strip=True).lower() for h in soup.find_all("h1")]
 
     def has_geo(s: str) -> bool:
-        return any(re.search(p, s, re.IGNORECASE) for p in LOCAL_GEO_PATTERNS)
+        return any(r.search(s) for r in GEO_RES)
 
     geo_in_title = has_geo(title_text)
     geo_in_h1    = any(has_geo(h) for h in h1_texts)